@@ -3,145 +3,587 @@ Google Cloud API Core Functions
 This module contains all the Google Cloud API operations used by the application.
 """
 
+import os
 import sys
+import re
 import json
+import time
+import functools
+import inspect
+import importlib
+import shutil
+import itertools
+import threading
 import subprocess
+import configparser
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Dict, Any, Optional, Tuple
 
-# Google Cloud imports
-from google.cloud.devtools import cloudbuild_v1
-from google.cloud import run_v2, logging_v2, iam, resourcemanager_v3, artifactregistry
-from google.auth import default
-from google.auth.exceptions import DefaultCredentialsError
+# orjson parses large gcloud JSON output several times faster than json
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Google Cloud imports are deferred until first use (see _sdk); the GAPIC
+# client packages take seconds to import and most calls only need one of them.
+if TYPE_CHECKING:
+    from google.cloud import run_v2
+
+# Imported SDK modules, keyed by dotted module path
+_SDK_MODULES: Dict[str, Any] = {}
+
+
+def _sdk(module_path: str) -> Any:
+    """Import a Google Cloud SDK module on first use and cache it"""
+    module = _SDK_MODULES.get(module_path)
+    if module is None:
+        module = _SDK_MODULES[module_path] = importlib.import_module(module_path)
+    return module
+
+
+# Environment for gcloud subprocesses: skip the component update check and prompts
+_GCLOUD_ENV = {
+    **os.environ,
+    'CLOUDSDK_COMPONENT_MANAGER_DISABLE_UPDATE_CHECK': '1',
+    'CLOUDSDK_CORE_DISABLE_PROMPTS': '1',
+}
+
+
+def _gcloud_config_dir() -> str:
+    """Return the gcloud configuration directory"""
+    if os.environ.get('CLOUDSDK_CONFIG'):
+        return os.environ['CLOUDSDK_CONFIG']
+    if os.name == 'nt':
+        return os.path.join(os.environ.get('APPDATA', ''), 'gcloud')
+    return os.path.join(os.path.expanduser('~'), '.config', 'gcloud')
+
+
+def _read_gcloud_property(key: str) -> Optional[str]:
+    """Read a gcloud property such as 'project' or 'run/region' without the CLI
+
+    Looks at the CLOUDSDK_<SECTION>_<NAME> override and then the active named
+    configuration; returns None when the property is not set in either or the
+    file cannot be parsed, so the caller falls back to the CLI.
+    """
+    section, _, name = key.rpartition('/')
+    section = section or 'core'
+    value = os.environ.get(f"CLOUDSDK_{section}_{name}".upper().replace('-', '_'))
+    if value:
+        return value
+    
+    config_dir = _gcloud_config_dir()
+    active = os.environ.get('CLOUDSDK_ACTIVE_CONFIG_NAME')
+    if not active:
+        try:
+            with open(os.path.join(config_dir, 'active_config')) as f:
+                active = f.read().strip()
+        except OSError:
+            pass
+    
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        parser.read(os.path.join(config_dir, 'configurations', f"config_{active or 'default'}"))
+    except configparser.Error:
+        # Leave files gcloud can parse but configparser cannot to the CLI
+        return None
+    return parser.get(section, name, fallback=None) or None
+
+
+# Number of gRPC connections opened per API client; raise for high-throughput use
+_GRPC_POOL_SIZE = max(1, int(os.environ.get('GCLOUDUI_GRPC_POOL', '1')))
+
+# Application Default Credentials, reused until the credentials file changes
+_ADC_CACHE: Dict[str, Any] = {'creds': None, 'project': None, 'path': None, 'mtime': 0}
+_ADC_LOCK = threading.Lock()
+
+
+def _adc_path() -> str:
+    """Return the credentials file google.auth.default() reads"""
+    path = os.environ.get('GOOGLE_APPLICATION_CREDENTIALS')
+    if path:
+        return path
+    return os.path.join(_gcloud_config_dir(), 'application_default_credentials.json')
+
+
+def _get_default() -> tuple:
+    """Return google.auth.default(), cached until the ADC file is replaced"""
+    path = _adc_path()
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        # No file: credentials come from the metadata server or are missing
+        mtime = 0
+    
+    with _ADC_LOCK:
+        if (_ADC_CACHE['creds'] is None
+                or _ADC_CACHE['path'] != path
+                or _ADC_CACHE['mtime'] != mtime):
+            credentials, project = _sdk('google.auth').default()
+            _ADC_CACHE.update(creds=credentials, project=project, path=path, mtime=mtime)
+        return _ADC_CACHE['creds'], _ADC_CACHE['project']
+
+
+def _pooled_factory(client_cls):
+    """Return a factory building a GAPIC client on its own gRPC connection when pooling"""
+    if _GRPC_POOL_SIZE == 1:
+        return client_cls
+
+    def factory():
+        transport_cls = client_cls.get_transport_class('grpc')
+        # A local subchannel pool stops gRPC from sharing one connection across channels
+        channel = transport_cls.create_channel(
+            credentials=_get_default()[0],
+            options=[('grpc.use_local_subchannel_pool', 1)]
+        )
+        return client_cls(transport=transport_cls(channel=channel))
+
+    # _get_client builds this many clients for the key; other factories get one
+    factory.pool_size = _GRPC_POOL_SIZE
+    return factory
+
+
+# Upper bound on log entries fetched per get_logs call
+_MAX_LOG_ENTRIES = int(os.environ.get('MAX_LOG_ENTRIES', '100'))
+
+# Streamed logs arrive a page at a time, so iter_log_pages can afford more
+_MAX_STREAMED_LOG_ENTRIES = 10 * _MAX_LOG_ENTRIES
+_LOG_PAGE_SIZE = 50
+
+# Seconds a successful list response is reused; half the UI refresh interval
+_RESPONSE_TTL = int(os.environ.get('REFRESH_INTERVAL', '30')) // 2
+
+
+def _ttl_cached(method):
+    """Cache successful responses of a GCloudAPI list method for _RESPONSE_TTL seconds.
+
+    Concurrent calls with the same arguments share a single in-flight request.
+    Arguments are bound to the signature with defaults applied, so get_logs()
+    and get_logs("resource.type=cloud_run_revision") share one entry.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = tuple(bound.arguments.items())[1:]
+        key = (method.__name__, self.project_id, self.location, arguments)
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = Future()
+                owner = True
+            else:
+                owner = False
+        
+        if not owner:
+            return future.result()
+        
+        try:
+            result = method(self, *args, **kwargs)
+        except BaseException as e:
+            with self._cache_lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        
+        with self._cache_lock:
+            if result.get('success'):
+                self._response_cache[key] = (time.monotonic() + _RESPONSE_TTL, result)
+            del self._inflight[key]
+        future.set_result(result)
+        return result
+
+    return wrapper
+
+
+# LogSeverity number -> name, built on first use by severity_name
+_SEVERITY_NAMES: Dict[int, str] = {}
+
+
+def severity_name(severity: Any) -> str:
+    """Return the display name of a log severity given as a name, number or enum"""
+    if severity is None:
+        return 'DEFAULT'
+    if isinstance(severity, str):
+        return severity
+    if not _SEVERITY_NAMES:
+        log_severity = _sdk('google.logging.type.log_severity_pb2').LogSeverity
+        _SEVERITY_NAMES.update((v.number, v.name) for v in log_severity.DESCRIPTOR.values)
+    return _SEVERITY_NAMES.get(int(severity), str(severity))
+
+
+def _log_columns(entries: Iterable[Any]) -> Dict[str, List[Any]]:
+    """Collect log entries column-wise, as returned under get_logs' 'data'"""
+    logs = {'timestamps': [], 'severities': [], 'payloads': [], 'resources': []}
+    timestamps = logs['timestamps']
+    severities = logs['severities']
+    payloads = logs['payloads']
+    resources = logs['resources']
+    for entry in entries:
+        timestamps.append(entry.timestamp)
+        severities.append(entry.severity)
+        payloads.append(entry.payload or 'No payload')
+        resources.append(entry.resource.type if entry.resource else 'Unknown')
+    return logs
+
+
+# Registry for image names without a host, as in docker
+_DEFAULT_REGISTRY = 'registry-1.docker.io'
+
+# Manifest media types accepted when probing a registry: single-arch and
+# multi-arch images in both Docker and OCI formats
+_MANIFEST_TYPES = ', '.join((
+    'application/vnd.docker.distribution.manifest.v2+json',
+    'application/vnd.docker.distribution.manifest.list.v2+json',
+    'application/vnd.oci.image.manifest.v1+json',
+    'application/vnd.oci.image.index.v1+json',
+))
+
+# key="value" pairs of a WWW-Authenticate challenge
+_CHALLENGE_PARAM = re.compile(r'(\w+)="([^"]*)"')
+
+
+def _is_google_registry(host: str) -> bool:
+    """Whether host is a Container Registry or Artifact Registry endpoint"""
+    return host == 'gcr.io' or host.endswith(('.gcr.io', '-docker.pkg.dev'))
+
+
+# Skeleton Cloud Run service cloned for each create request, built on first use
+_SERVICE_TEMPLATE = None
+
+
+def _new_service_proto() -> 'run_v2.Service':
+    """Return a new Service message copied from the cached skeleton"""
+    global _SERVICE_TEMPLATE
+    run_v2 = _sdk('google.cloud.run_v2')
+    if _SERVICE_TEMPLATE is None:
+        _SERVICE_TEMPLATE = run_v2.Service(
+            template=run_v2.RevisionTemplate(
+                containers=[
+                    run_v2.Container(
+                        ports=[run_v2.ContainerPort(container_port=8080)],
+                        resources=run_v2.ResourceRequirements(
+                            limits={'cpu': '1000m', 'memory': '512Mi'}
+                        )
+                    )
+                ]
+            )
+        )
+    service = run_v2.Service()
+    run_v2.Service.copy_from(service, _SERVICE_TEMPLATE)
+    return service
 
 
 class GCloudAPI:
     """Core Google Cloud API operations"""
+
+    # gcloud commands that change the active credentials
+    _ACCOUNT_COMMANDS = (
+        ('auth', 'login'),
+        ('auth', 'revoke'),
+        ('auth', 'activate-service-account'),
+        ('auth', 'application-default', 'login'),
+        ('auth', 'application-default', 'revoke'),
+    )
+
+    # Read-only gcloud verbs whose output is requested as JSON when no format is given
+    _JSON_VERBS = ('list', 'describe', 'get-iam-policy')
+
+    # Independent read-only listings fetched together by refresh_all
+    _REFRESH_GETTERS = (
+        'get_cloud_run_services',
+        'get_container_images',
+        'get_logs',
+        'get_service_accounts',
+        'get_permissions',
+    )
     
     def __init__(self, project_id: str = None, location: str = "us-central1"):
-        self.project_id = project_id
-        self.location = location
-        
-        # Try to get default project if not provided
-        if not self.project_id:
-            try:
-                credentials, project = default()
-                if project:
-                    self.project_id = project
-                else:
-                    self.project_id = "your-project-id"
-            except DefaultCredentialsError:
-                self.project_id = "your-project-id"
+        # A project exported by the environment saves resolving ADC at all;
+        # otherwise the ADC project is resolved on first use (see project_id)
+        if not project_id:
+            project_id = os.environ.get('GOOGLE_CLOUD_PROJECT') or os.environ.get('GCP_PROJECT')
+        self._project_id = project_id
+        self._location = location
+        self._paths: Optional[Tuple[str, str, List[str]]] = None
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+        self._response_cache: Dict[tuple, tuple] = {}
+        self._inflight: Dict[tuple, Future] = {}
+        self._cache_lock = threading.Lock()
+        self._http = None
+        self._auth_cache: Optional[Dict[str, Any]] = None
+
+    @property
+    def needs_default_project(self) -> bool:
+        """Whether no project was given, so project_id will come from ADC"""
+        return self._project_id is None
+
+    @property
+    def project_id(self) -> str:
+        """Google Cloud project the API operates on
+
+        Without an explicit project the first read resolves the ADC project,
+        which may block on the metadata server; callers on the UI thread
+        should set it from a check_auth result instead.
+        """
+        if self._project_id is None:
+            auth_result = self.check_authentication()
+            self.project_id = auth_result['project'] or "your-project-id"
+        return self._project_id
+
+    @project_id.setter
+    def project_id(self, value: str):
+        self._project_id = value
+        self._update_resource_paths()
+
+    @property
+    def location(self) -> str:
+        """Region used for regional resources"""
+        return self._location
+
+    @location.setter
+    def location(self, value: str):
+        self._location = value
+        self._update_resource_paths()
+
+    def _update_resource_paths(self):
+        """Drop the resource names derived from project_id and location"""
+        self._paths = None
+
+    def _resource_paths(self) -> Tuple[str, str, List[str]]:
+        """Return (project path, location parent, log resource names), built once"""
+        paths = self._paths
+        if paths is None:
+            project_path = f"projects/{self.project_id}"
+            paths = self._paths = (
+                project_path,
+                f"{project_path}/locations/{self._location}",
+                [project_path],
+            )
+        return paths
+
+    @property
+    def _project_path(self) -> str:
+        return self._resource_paths()[0]
+
+    @property
+    def _parent(self) -> str:
+        return self._resource_paths()[1]
+
+    @property
+    def _log_resource_names(self) -> List[str]:
+        return self._resource_paths()[2]
+
+    def _get_client(self, key: str, factory) -> Any:
+        """Return a cached client for key, constructing the pool with factory on first use
+
+        Factories from _pooled_factory get a pool of _GRPC_POOL_SIZE clients
+        used round-robin; any other factory is called once.
+        """
+        with self._clients_lock:
+            pool = self._clients.get(key)
+            if pool is None:
+                pool_size = getattr(factory, 'pool_size', 1)
+                pool = self._clients[key] = itertools.cycle(
+                    [factory() for _ in range(pool_size)]
+                )
+            return next(pool)
+
+    def _http_session(self) -> Any:
+        """Return the shared requests session used for REST calls, creating it on first use"""
+        with self._clients_lock:
+            if self._http is None:
+                requests = _sdk('requests')
+                retry = _sdk('urllib3.util.retry').Retry(total=3, backoff_factor=0.3)
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=16, pool_maxsize=16, max_retries=retry
+                )
+                self._http = requests.Session()
+                self._http.mount('https://', adapter)
+            return self._http
+
+    def close(self):
+        """Close pooled HTTP connections and drop cached API clients"""
+        with self._clients_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+            self._clients.clear()
+
+    def invalidate(self):
+        """Drop cached clients and credentials so they are rebuilt on next use"""
+        with self._clients_lock:
+            self._clients.clear()
+        with _ADC_LOCK:
+            _ADC_CACHE['creds'] = None
+        self._auth_cache = None
+        self.invalidate_cache()
+
+    def invalidate_cache(self, method: Optional[str] = None):
+        """Drop cached list responses, for one method name or all of them"""
+        with self._cache_lock:
+            if method is None:
+                self._response_cache.clear()
+            else:
+                for key in [key for key in self._response_cache if key[0] == method]:
+                    del self._response_cache[key]
     
-    def get_cloud_run_services(self) -> Dict[str, Any]:
-        """Get Cloud Run services"""
+    @_ttl_cached
+    def get_cloud_run_services(self, limit: int = 100, page_token: str = "") -> Dict[str, Any]:
+        """Get up to limit Cloud Run services, starting at page_token"""
         try:
-            client = run_v2.ServicesClient()
-            parent = f"projects/{self.project_id}/locations/{self.location}"
-            
-            request = run_v2.ListServicesRequest(parent=parent)
-            page_result = client.list_services(request=request)
+            run_v2 = _sdk('google.cloud.run_v2')
+            client = self._get_client('run', _pooled_factory(run_v2.ServicesClient))
+            request = run_v2.ListServicesRequest(parent=self._parent, page_size=limit, page_token=page_token)
+            # Only the first page: iterating the pager would fetch further pages
+            # and the returned token would skip whatever was cut off
+            page = next(iter(client.list_services(request=request).pages))
             
             services = []
-            for service in page_result:
+            for service in page.services:
                 services.append({
                     'name': service.name,
-                    'status': service.status.conditions[-1].type if service.status.conditions else 'Unknown',
-                    'url': service.status.url,
-                    'revision': service.status.latest_ready_revision_name,
-                    'created': service.metadata.create_time.isoformat() if service.metadata.create_time else 'Unknown'
+                    'short_name': service.name.rsplit('/', 1)[-1],
+                    'status': service.conditions[-1].type_ if service.conditions else 'Unknown',
+                    'url': service.uri,
+                    'revision': service.latest_ready_revision.rsplit('/', 1)[-1],
+                    'created': service.create_time.isoformat() if service.create_time else 'Unknown'
                 })
             
-            return {'type': 'services', 'data': services, 'success': True}
+            return {
+                'type': 'services',
+                'data': services,
+                'success': True,
+                'next_page_token': page.next_page_token
+            }
         except Exception as e:
             return {'type': 'services', 'data': [], 'success': False, 'error': str(e)}
 
     def create_cloud_run_service(self, service_config: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new Cloud Run service"""
         try:
-            client = run_v2.ServicesClient()
-            parent = f"projects/{self.project_id}/locations/{self.location}"
-            
-            # Create service request
-            service = run_v2.Service(
-                name=f"{parent}/services/{service_config.get('name', 'new-service')}",
-                template=run_v2.RevisionTemplate(
-                    containers=[
-                        run_v2.Container(
-                            image=service_config.get('image', 'gcr.io/project/image'),
-                            ports=[run_v2.ContainerPort(container_port=service_config.get('port', 8080))],
-                            resources=run_v2.ResourceRequirements(
-                                limits={
-                                    'cpu': service_config.get('cpu', '1000m'),
-                                    'memory': service_config.get('memory', '512Mi')
-                                }
-                            )
-                        )
-                    ]
-                )
-            )
+            run_v2 = _sdk('google.cloud.run_v2')
+            client = self._get_client('run', _pooled_factory(run_v2.ServicesClient))
+            parent = self._parent
+            
+            # Create service request from the skeleton, setting only per-service fields
+            service = _new_service_proto()
+            service.name = f"{parent}/services/{service_config.get('name', 'new-service')}"
+            container = service.template.containers[0]
+            container.image = service_config.get('image', 'gcr.io/project/image')
+            container.ports[0].container_port = service_config.get('port', 8080)
+            container.resources.limits['cpu'] = service_config.get('cpu', '1000m')
+            container.resources.limits['memory'] = service_config.get('memory', '512Mi')
             
             operation = client.create_service(parent=parent, service=service)
+            self.invalidate_cache('get_cloud_run_services')
             
             return {'type': 'service_created', 'data': {'operation': operation.name}, 'success': True}
         except Exception as e:
             return {'type': 'service_created', 'data': {}, 'success': False, 'error': str(e)}
 
-    def get_container_images(self) -> Dict[str, Any]:
-        """Get container images from registry"""
+    @_ttl_cached
+    def get_container_images(self, limit: int = 100, page_token: str = "") -> Dict[str, Any]:
+        """Get up to limit container image repositories, starting at page_token"""
         try:
-            client = artifactregistry.ArtifactRegistryClient()
-            parent = f"projects/{self.project_id}/locations/{self.location}"
-            
-            request = {"parent": parent}
-            page_result = client.list_repositories(request=request)
+            artifactregistry = _sdk('google.cloud.artifactregistry')
+            client = self._get_client('artifactregistry', _pooled_factory(artifactregistry.ArtifactRegistryClient))
+            request = {"parent": self._parent, "page_size": limit, "page_token": page_token}
+            page = next(iter(client.list_repositories(request=request).pages))
             
             images = []
-            for repository in page_result:
+            for repository in page.repositories:
                 images.append({
                     'name': repository.name,
                     'format': repository.format_.name if hasattr(repository, 'format_') else 'DOCKER',
                     'description': repository.description or 'No description'
                 })
             
-            return {'type': 'images', 'data': images, 'success': True}
+            return {
+                'type': 'images',
+                'data': images,
+                'success': True,
+                'next_page_token': page.next_page_token
+            }
         except Exception as e:
             return {'type': 'images', 'data': [], 'success': False, 'error': str(e)}
 
-    def get_logs(self, filter_str: str = "resource.type=cloud_run_revision") -> Dict[str, Any]:
-        """Get logs from Cloud Logging"""
+    @_ttl_cached
+    def get_logs(self, filter_str: str = "resource.type=cloud_run_revision",
+                 max_entries: int = _MAX_LOG_ENTRIES) -> Dict[str, Any]:
+        """Get logs from Cloud Logging
+
+        Entries are returned column-wise with raw timestamps and severities
+        (see severity_name); formatting is left to the UI so only displayed
+        entries pay for it.
+        """
         try:
-            client = logging_v2.Client()
-            
-            # Get recent logs
-            resource_names = [f"projects/{self.project_id}"]
+            logging_v2 = _sdk('google.cloud.logging_v2')
+            client = self._get_client('logging', lambda: logging_v2.Client(
+                project=self.project_id, credentials=_get_default()[0]
+            ))
             
             # Use the client's list_entries method
             entries = client.list_entries(
-                resource_names=resource_names,
+                resource_names=self._log_resource_names,
                 filter_=filter_str,
                 order_by="timestamp desc",
-                page_size=50
+                page_size=max_entries
             )
             
-            logs = []
-            for entry in entries:
-                logs.append({
-                    'timestamp': entry.timestamp.isoformat() if entry.timestamp else 'Unknown',
-                    'severity': entry.severity.name,
-                    'text_payload': entry.text_payload or 'No payload',
-                    'resource': entry.resource.type
-                })
-            
+            logs = _log_columns(itertools.islice(entries, max_entries))
             return {'type': 'logs', 'data': logs, 'success': True}
         except Exception as e:
-            return {'type': 'logs', 'data': [], 'success': False, 'error': str(e)}
+            return {'type': 'logs', 'data': _log_columns(()), 'success': False, 'error': str(e)}
+
+    def iter_log_pages(self, filter_str: str = "resource.type=cloud_run_revision",
+                       max_entries: int = _MAX_STREAMED_LOG_ENTRIES,
+                       page_size: int = _LOG_PAGE_SIZE) -> Iterator[Dict[str, Any]]:
+        """Yield logs from Cloud Logging one page at a time
+
+        Each page is a get_logs-style result with 'partial': True. The stream
+        ends with an empty result, or an error, with 'partial': False.
+        """
+        try:
+            logging_v2 = _sdk('google.cloud.logging_v2')
+            client = self._get_client('logging', lambda: logging_v2.Client(
+                project=self.project_id, credentials=_get_default()[0]
+            ))
+            page_size = min(page_size, max_entries)
+            entries = client.list_entries(
+                resource_names=self._log_resource_names,
+                filter_=filter_str,
+                order_by="timestamp desc",
+                max_results=max_entries,
+                page_size=page_size
+            )
+            
+            # The gRPC transport returns a plain generator with no .pages, so
+            # cut the entry stream into pages here
+            entries = iter(entries)
+            while True:
+                logs = _log_columns(itertools.islice(entries, page_size))
+                if not logs['timestamps']:
+                    break
+                yield {'type': 'logs', 'data': logs, 'success': True, 'partial': True}
+            
+            yield {'type': 'logs', 'data': _log_columns(()), 'success': True, 'partial': False}
+        except Exception as e:
+            yield {'type': 'logs', 'data': _log_columns(()), 'success': False, 'partial': False, 'error': str(e)}
 
     def build_image(self, build_config: Dict[str, Any]) -> Dict[str, Any]:
         """Build container image using Cloud Build"""
         try:
-            client = cloudbuild_v1.CloudBuildClient()
+            cloudbuild_v1 = _sdk('google.cloud.devtools.cloudbuild_v1')
+            client = self._get_client('cloudbuild', _pooled_factory(cloudbuild_v1.CloudBuildClient))
             
             # This is a simplified build request
             build_request = cloudbuild_v1.Build(
@@ -167,14 +609,82 @@ class GCloudAPI:
             return {'type': 'build_started', 'data': {}, 'success': False, 'error': str(e)}
 
     def push_image(self, image_name: str) -> Dict[str, Any]:
-        """Push image to container registry"""
+        """Push image to container registry
+
+        Images are pushed by Cloud Build (see build_image); this confirms the
+        image is present by probing its manifest through the registry v2 API.
+        """
         try:
-            # This would use docker commands or container registry API
-            # For now, return a success message
-            return {'type': 'push_completed', 'data': {'message': 'Image pushed successfully'}, 'success': True}
+            name, _, digest = image_name.partition('@')
+            host, _, repository = name.partition('/')
+            # As in docker: a first segment without '.' or ':' is part of the
+            # repository on Docker Hub, not a registry host
+            if not repository or not ('.' in host or ':' in host or host == 'localhost'):
+                host, repository = _DEFAULT_REGISTRY, name
+                if '/' not in repository:
+                    repository = f'library/{repository}'
+            elif host in ('docker.io', 'index.docker.io'):
+                host = _DEFAULT_REGISTRY
+            if digest:
+                reference = digest
+            elif ':' in repository.rsplit('/', 1)[-1]:
+                repository, _, reference = repository.rpartition(':')
+            else:
+                reference = 'latest'
+            
+            http = self._http_session()
+            url = f"https://{host}/v2/{repository}/manifests/{reference}"
+            headers = {'Accept': _MANIFEST_TYPES}
+            response = http.head(url, headers=headers, timeout=10)
+            if response.status_code == 401:
+                # Registries hand out pull tokens from the realm in their challenge
+                token = self._registry_token(http, response.headers.get('WWW-Authenticate', ''))
+                if token:
+                    headers['Authorization'] = f'Bearer {token}'
+                    response = http.head(url, headers=headers, timeout=10)
+            
+            if response.status_code != 200:
+                if response.status_code == 404:
+                    error = f'{image_name} not found in registry'
+                elif response.status_code in (401, 403):
+                    error = f'Not authorized to read {image_name} (HTTP {response.status_code})'
+                else:
+                    error = f'Registry returned HTTP {response.status_code} for {image_name}'
+                return {'type': 'push_completed', 'data': {}, 'success': False, 'error': error}
+            
+            return {'type': 'push_completed', 'data': {'message': f'Image {image_name} is in the registry'}, 'success': True}
         except Exception as e:
             return {'type': 'push_completed', 'data': {}, 'success': False, 'error': str(e)}
 
+    def _registry_token(self, http, challenge: str) -> Optional[str]:
+        """Fetch a registry pull token for a 'Bearer realm=...' challenge
+
+        Google credentials are sent only to HTTPS Google registry realms;
+        other registries are asked for an anonymous token.
+        """
+        scheme, _, params = challenge.partition(' ')
+        if scheme.lower() != 'bearer':
+            return None
+        fields = dict(_CHALLENGE_PARAM.findall(params))
+        realm = fields.pop('realm', '')
+        realm_url = urlsplit(realm)
+        if realm_url.scheme != 'https':
+            return None
+        
+        auth = None
+        if _is_google_registry(realm_url.hostname or ''):
+            credentials, _ = _get_default()
+            if not credentials.valid:
+                transport = _sdk('google.auth.transport.requests')
+                credentials.refresh(transport.Request(session=http))
+            auth = ('oauth2accesstoken', credentials.token)
+        
+        response = http.get(realm, params=fields, auth=auth, timeout=10)
+        if response.status_code != 200:
+            return None
+        body = response.json()
+        return body.get('token') or body.get('access_token')
+
     def get_service_accounts(self) -> Dict[str, Any]:
         """Get IAM service accounts"""
         try:
@@ -186,6 +696,7 @@ class GCloudAPI:
         except Exception as e:
             return {'type': 'service_accounts', 'data': [], 'success': False, 'error': str(e)}
 
+    @_ttl_cached
     def get_permissions(self) -> Dict[str, Any]:
         """Get IAM permissions and roles"""
         try:
@@ -199,44 +710,151 @@ class GCloudAPI:
 
     def add_permission(self, role: str, member: str) -> Dict[str, Any]:
         """Add IAM permission/role"""
+        return self.add_permissions([(role, member)])
+
+    def add_permissions(self, bindings: List[Tuple[str, str]]) -> Dict[str, Any]:
+        """Add several (role, member) IAM bindings with one policy read-modify-write"""
         try:
-            # For now, return success message since IAM client structure is different
-            # This would need to be implemented with the correct IAM API
-            return {'type': 'permission_added', 'data': {'message': f'Added {role} to {member}'}, 'success': True}
+            resourcemanager_v3 = _sdk('google.cloud.resourcemanager_v3')
+            client = self._get_client('resourcemanager', _pooled_factory(resourcemanager_v3.ProjectsClient))
+            resource = self._project_path
+            
+            # Version 3 returns conditional bindings with their conditions, so
+            # writing the policy back preserves them
+            policy = client.get_iam_policy(request={
+                'resource': resource,
+                'options': {'requested_policy_version': 3}
+            })
+            for role, member in bindings:
+                # Conditional bindings are left alone; grants go to the unconditional one
+                binding = next(
+                    (b for b in policy.bindings if b.role == role and not b.HasField('condition')),
+                    None
+                )
+                if binding is None:
+                    binding = policy.bindings.add(role=role)
+                if member not in binding.members:
+                    binding.members.append(member)
+            policy.version = 3
+            client.set_iam_policy(request={'resource': resource, 'policy': policy})
+            self.invalidate_cache('get_permissions')
+            
+            message = '; '.join(f'Added {role} to {member}' for role, member in bindings)
+            return {'type': 'permission_added', 'data': {'message': message}, 'success': True}
         except Exception as e:
             return {'type': 'permission_added', 'data': {}, 'success': False, 'error': str(e)}
 
-    def check_authentication(self) -> Dict[str, Any]:
-        """Check Google Cloud authentication"""
+    def batch_permissions(self) -> 'PermissionBatcher':
+        """Collect add_permission calls and apply them in one policy update on exit"""
+        return PermissionBatcher(self)
+
+    def refresh_all(self, names: Iterable[str] = _REFRESH_GETTERS) -> Dict[str, Dict[str, Any]]:
+        """Run list operations concurrently and return their results keyed by type
+
+        Uses one short-lived thread per getter named in names, by default every
+        getter in _REFRESH_GETTERS.
+        """
+        getters = [getattr(self, name) for name in names]
+        with ThreadPoolExecutor(max_workers=len(getters)) as executor:
+            results = list(executor.map(lambda getter: getter(), getters))
+        return {result['type']: result for result in results}
+
+    def check_authentication(self, force: bool = False) -> Dict[str, Any]:
+        """Check Google Cloud authentication
+
+        A successful result is remembered on the instance; pass force=True to
+        resolve credentials again. A failed check drops cached clients and
+        credentials (see invalidate) so nothing built on them is reused.
+        """
+        if force:
+            self.invalidate()
+        elif self._auth_cache is not None:
+            return self._auth_cache
+        
+        auth_exceptions = _sdk('google.auth.exceptions')
         try:
-            credentials, project = default()
+            credentials, project = _get_default()
             if project:
-                return {'success': True, 'project': project, 'authenticated': True}
-            else:
-                return {'success': False, 'project': None, 'authenticated': False, 'error': 'No default project set'}
-        except DefaultCredentialsError:
-            return {'success': False, 'project': None, 'authenticated': False, 'error': 'Not authenticated'}
+                self._auth_cache = {'success': True, 'project': project, 'authenticated': True}
+                return self._auth_cache
+            result = {'success': False, 'project': None, 'authenticated': False, 'error': 'No default project set'}
+        except auth_exceptions.DefaultCredentialsError:
+            result = {'success': False, 'project': None, 'authenticated': False, 'error': 'Not authenticated'}
+        
+        self.invalidate()
+        return result
 
     def run_gcloud_command(self, command: List[str]) -> Dict[str, Any]:
-        """Run a gcloud command and return the result"""
+        """Run a gcloud command and return the result
+
+        Read-only commands without an explicit --format are run with
+        --format=json and their parsed output is returned under 'json'.
+        'config get-value' lookups are cached until a config command or one of
+        _ACCOUNT_COMMANDS succeeds.
+        """
+        if command[:2] == ['config', 'get-value'] and len(command) == 3:
+            return self._gcloud_config_value(command[2])
+        
+        response = self._run_gcloud(command)
+        if response['success']:
+            if any(tuple(command[:len(prefix)]) == prefix for prefix in self._ACCOUNT_COMMANDS):
+                # The active account has changed under the cached clients
+                self.invalidate()
+            elif command[:1] == ['config']:
+                self.invalidate_cache('_gcloud_config_value')
+        return response
+
+    @_ttl_cached
+    def _gcloud_config_value(self, key: str) -> Dict[str, Any]:
+        """Resolve 'gcloud config get-value key', falling back to the CLI"""
+        value = _read_gcloud_property(key)
+        if value is not None:
+            return {
+                'success': True,
+                'stdout': value + '\n',
+                'stderr': '',
+                'return_code': 0
+            }
+        return self._run_gcloud(['config', 'get-value', key])
+
+    def _run_gcloud(self, command: List[str]) -> Dict[str, Any]:
+        """Run command with the gcloud CLI"""
+        # A PATH lookup is far cheaper than spawning a process only to fail
+        gcloud = shutil.which('gcloud')
+        if gcloud is None:
+            return {
+                'success': False,
+                'error': 'gcloud command not found'
+            }
+        
+        if (not any(arg.startswith('--format') for arg in command)
+                and any(arg in self._JSON_VERBS for arg in command)):
+            command = command + ['--format=json']
+        
         try:
             result = subprocess.run(
-                ['gcloud'] + command,
+                [gcloud] + command,
                 capture_output=True,
-                text=True,
-                check=True
+                check=True,
+                env=_GCLOUD_ENV
             )
-            return {
+            response = {
                 'success': True,
-                'stdout': result.stdout,
-                'stderr': result.stderr,
+                'stdout': result.stdout.decode(errors='replace'),
+                'stderr': result.stderr.decode(errors='replace'),
                 'return_code': result.returncode
             }
+            if '--format=json' in command:
+                try:
+                    response['json'] = _json_loads(result.stdout or b'null')
+                except ValueError:
+                    response['json'] = None
+            return response
         except subprocess.CalledProcessError as e:
             return {
                 'success': False,
-                'stdout': e.stdout,
-                'stderr': e.stderr,
+                'stdout': e.stdout.decode(errors='replace'),
+                'stderr': e.stderr.decode(errors='replace'),
                 'return_code': e.returncode,
                 'error': str(e)
             }
@@ -244,4 +862,25 @@ class GCloudAPI:
             return {
                 'success': False,
                 'error': 'gcloud command not found'
-            } 
\ No newline at end of file
+            }
+
+
+class PermissionBatcher:
+    """Context manager that queues IAM grants and flushes them with add_permissions"""
+
+    def __init__(self, gcloud_api: GCloudAPI):
+        self.gcloud_api = gcloud_api
+        self.bindings: List[Tuple[str, str]] = []
+        self.result: Optional[Dict[str, Any]] = None
+
+    def add(self, role: str, member: str):
+        """Queue a role grant for member"""
+        self.bindings.append((role, member))
+
+    def __enter__(self) -> 'PermissionBatcher':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and self.bindings:
+            self.result = self.gcloud_api.add_permissions(self.bindings)
+        return False
@@ -5,6 +5,7 @@ This is the main entry point for the application.
 
 import sys
 from PyQt6.QtWidgets import QApplication
+from PyQt6.QtCore import QTimer
 
 from ui.main_window import GCloudAccessApp
 
@@ -17,6 +18,9 @@ def main():
     window = GCloudAccessApp()
     window.show()
     
+    # Finish building the window from the event loop so it paints first
+    QTimer.singleShot(0, window.finish_init)
+    
     sys.exit(app.exec())
 
 
@@ -3,22 +3,16 @@ Main Window UI Component
 This module contains the main application window with tabbed interface.
 """
 
-import sys
-from typing import List, Dict, Any, Optional
-
-from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QTabWidget, QTableWidget, QTableWidgetItem, QPushButton, QLabel,
-    QTextEdit, QLineEdit, QComboBox, QGroupBox, QFormLayout, QMessageBox,
-    QProgressBar, QSplitter, QListWidget, QListWidgetItem, QTreeWidget,
-    QTreeWidgetItem, QHeaderView, QFrame, QScrollArea
-)
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QFont, QIcon, QPixmap
+from typing import Dict, Any, Optional
+
+from PyQt6.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QTabWidget, QMessageBox
+from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QAction
 
 from core.gcloudapi import GCloudAPI
-from ui.workers import GCloudWorker
+from ui.workers import GCloudRunnable, PrefetchCoordinator, hard_refresh_requested, stop_workers, worker_pool
 from ui.tabs import (
+    BaseTab,
     ServicesTab,
     BuildTab,
     ImagesTab,
@@ -29,23 +23,48 @@ from ui.tabs import (
 
 class GCloudAccessApp(QMainWindow):
     """Main application window"""
+
+    # (attribute, class, title) for each tab, in display order
+    TABS = (
+        ('services_tab', ServicesTab, "Cloud Run Services"),
+        ('build_tab', BuildTab, "Cloud Build"),
+        ('images_tab', ImagesTab, "Container Images"),
+        ('logs_tab', LogsTab, "Logs"),
+        ('iam_tab', IAMTab, "IAM Management"),
+    )
+
+    # Tab attribute -> (prefetch key, loaded slot) for tabs filled at start-up
+    PREFETCHED = {
+        'services_tab': ('services', 'on_services_loaded'),
+        'images_tab': ('images', 'on_images_loaded'),
+        'logs_tab': ('logs', 'on_logs_loaded'),
+    }
     
     def __init__(self):
         super().__init__()
+        self.gcloud_api = None
+        self.pool = worker_pool()
+        
+        # Only the window frame is set up here so it can paint immediately;
+        # the API client and tabs are created by finish_init
+        self.setWindowTitle("Google Cloud Access Tool")
+        self.setGeometry(100, 100, 1200, 800)
+        self.statusBar().showMessage("Loading...")
+
+    def finish_init(self):
+        """Create the API client and tabs once the window is on screen"""
         self.gcloud_api = GCloudAPI()
-        self.workers = []
+        self.prefetcher = PrefetchCoordinator(self)
         
         self.init_ui()
         self.setup_connections()
         
-        # Check authentication
-        self.check_auth()
+        # Check authentication and load initial data off the UI thread
+        QTimer.singleShot(0, self.check_auth)
+        self.start_worker("prefetch", self.prefetcher.distribute)
 
     def init_ui(self):
         """Initialize the user interface"""
-        self.setWindowTitle("Google Cloud Access Tool")
-        self.setGeometry(100, 100, 1200, 800)
-        
         # Create central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -60,45 +79,79 @@ class GCloudAccessApp(QMainWindow):
         # Create tabs
         self.create_tabs()
         
+        # Toolbar
+        toolbar = self.addToolBar("Main")
+        refresh_all_action = QAction("Refresh All", self)
+        refresh_all_action.triggered.connect(self.refresh_all)
+        toolbar.addAction(refresh_all_action)
+        
         # Status bar
         self.statusBar().showMessage("Ready")
 
     def create_tabs(self):
-        """Create all the application tabs"""
-        # Services tab
-        self.services_tab = ServicesTab(self.gcloud_api)
-        self.tab_widget.addTab(self.services_tab, "Cloud Run Services")
-        
-        # Build tab
-        self.build_tab = BuildTab(self.gcloud_api)
-        self.tab_widget.addTab(self.build_tab, "Cloud Build")
-        
-        # Images tab
-        self.images_tab = ImagesTab(self.gcloud_api)
-        self.tab_widget.addTab(self.images_tab, "Container Images")
-        
-        # Logs tab
-        self.logs_tab = LogsTab(self.gcloud_api)
-        self.tab_widget.addTab(self.logs_tab, "Logs")
-        
-        # IAM tab
-        self.iam_tab = IAMTab(self.gcloud_api)
-        self.tab_widget.addTab(self.iam_tab, "IAM Management")
+        """Add a placeholder for each tab; the real tab is built when first shown"""
+        for attr, tab_class, title in self.TABS:
+            setattr(self, attr, None)
+            self.tab_widget.addTab(QWidget(), title)
 
     def setup_connections(self):
         """Setup signal connections between components"""
-        # Connect tab signals to main window handlers
-        self.services_tab.error_occurred.connect(self.on_error)
-        self.build_tab.error_occurred.connect(self.on_error)
-        self.images_tab.error_occurred.connect(self.on_error)
-        self.logs_tab.error_occurred.connect(self.on_error)
-        self.iam_tab.error_occurred.connect(self.on_error)
+        self.tab_widget.currentChanged.connect(self.materialize_tab)
+        self.materialize_tab(self.tab_widget.currentIndex())
 
-    def check_auth(self):
-        """Check Google Cloud authentication"""
-        auth_result = self.gcloud_api.check_authentication()
+    def materialize_tab(self, index: int) -> Optional[BaseTab]:
+        """Return the tab at index, replacing its placeholder on first use"""
+        if index < 0:
+            return None
         
+        attr, tab_class, title = self.TABS[index]
+        tab = getattr(self, attr)
+        if tab is None:
+            tab = tab_class(self.gcloud_api)
+            tab.error_occurred.connect(self.on_error)
+            setattr(self, attr, tab)
+            
+            if attr in self.PREFETCHED:
+                key, slot = self.PREFETCHED[attr]
+                handler = getattr(tab, slot)
+                getattr(self.prefetcher, f"{key}_loaded").connect(handler)
+                if key in self.prefetcher.results:
+                    handler(self.prefetcher.results[key])
+            
+            # Swapping pages moves the current index; keep it and stay silent
+            current = self.tab_widget.currentIndex()
+            placeholder = self.tab_widget.widget(index)
+            self.tab_widget.blockSignals(True)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, title)
+            self.tab_widget.setCurrentIndex(current)
+            self.tab_widget.blockSignals(False)
+            placeholder.deleteLater()
+        return tab
+
+    def get_tab(self, attr: str) -> BaseTab:
+        """Return the tab stored under attr, building it if needed"""
+        index = next(i for i, (name, _, _) in enumerate(self.TABS) if name == attr)
+        return self.materialize_tab(index)
+
+    def start_worker(self, operation: str, on_result, **kwargs):
+        """Run operation in a background worker and pass its result to on_result"""
+        if hard_refresh_requested():
+            GCloudRunnable.invalidate(self.gcloud_api, operation)
+        runnable = GCloudRunnable(operation, self.gcloud_api, **kwargs)
+        runnable.signals.result_ready.connect(on_result)
+        runnable.signals.error_occurred.connect(self.on_error)
+        self.pool.start(runnable)
+
+    def check_auth(self):
+        """Check Google Cloud authentication in a background worker"""
+        self.start_worker("check_auth", self.on_auth_checked)
+
+    def on_auth_checked(self, auth_result: Dict[str, Any]):
+        """Report the authentication check result"""
         if auth_result['success'] and auth_result['authenticated']:
+            if self.gcloud_api.needs_default_project:
+                self.gcloud_api.project_id = auth_result['project']
             self.statusBar().showMessage(f"Authenticated with project: {auth_result['project']}")
         else:
             QMessageBox.warning(
@@ -107,6 +160,21 @@ class GCloudAccessApp(QMainWindow):
                 f"Please run 'gcloud auth application-default login' to authenticate.\nError: {auth_result.get('error', 'Unknown error')}"
             )
 
+    def refresh_all(self):
+        """Refresh all listing tabs with a single concurrent fetch"""
+        self.statusBar().showMessage("Refreshing...")
+        self.start_worker("refresh_all", self.on_refresh_all_loaded)
+
+    def on_refresh_all_loaded(self, results: Dict[str, Any]):
+        """Distribute refresh_all results to the tabs"""
+        self.get_tab('services_tab').on_services_loaded(results['services'])
+        self.get_tab('images_tab').on_images_loaded(results['images'])
+        self.get_tab('logs_tab').on_logs_loaded(results['logs'])
+        iam_tab = self.get_tab('iam_tab')
+        iam_tab.on_service_accounts_loaded(results['service_accounts'])
+        iam_tab.on_permissions_loaded(results['permissions'])
+        self.statusBar().showMessage("Ready")
+
     def on_error(self, error_message: str):
         """Handle errors from workers and tabs"""
         QMessageBox.critical(self, "Error", f"Operation failed: {error_message}")
@@ -114,10 +182,9 @@ class GCloudAccessApp(QMainWindow):
 
     def closeEvent(self, event):
         """Handle application close event"""
-        # Clean up any running workers
-        for worker in self.workers:
-            if worker.isRunning():
-                worker.terminate()
-                worker.wait()
+        # Tabs share the window's thread pool, so one drain covers them all
+        stop_workers()
         
+        if self.gcloud_api is not None:
+            self.gcloud_api.close()
         event.accept() 
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""
+UI Table Models
+This module contains the item models backing the tab tables.
+"""
+
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Tuple, Union
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+Column = Tuple[str, Union[str, Callable[[Dict[str, Any]], Any]]]
+
+
+class RecordTableModel(QAbstractTableModel):
+    """Read-only table model over a list of dict records"""
+
+    def __init__(self, columns: List[Column], parent=None):
+        super().__init__(parent)
+        self._columns = columns
+        # One getter per column, resolved once instead of on every data() call
+        self._getters = [key if callable(key) else itemgetter(key) for _, key in columns]
+        self._rows: List[Dict[str, Any]] = []
+
+    def set_rows(self, rows: List[Dict[str, Any]]):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+
+        return self._getters[index.column()](self._rows[index.row()])
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._columns[section][0]
+        return None
@@ -3,18 +3,32 @@ UI Tab Components
 This module contains all the individual tab components for the application.
 """
 
+import functools
 from typing import Dict, Any, Optional
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QLabel, QTextEdit, QLineEdit, QComboBox, QGroupBox,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+    QPushButton, QLabel, QPlainTextEdit, QLineEdit, QComboBox, QGroupBox,
     QFormLayout, QMessageBox, QProgressBar, QSplitter, QTreeWidget,
     QTreeWidgetItem, QHeaderView, QFrame, QScrollArea
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
 
-from core.gcloudapi import GCloudAPI
-from ui.workers import GCloudWorker
+from core.gcloudapi import GCloudAPI, severity_name
+from ui.workers import GCloudRunnable, hard_refresh_requested, worker_pool
+from ui.models import RecordTableModel
+
+# Oldest lines are dropped once a log view holds this many
+LOG_VIEW_MAX_LINES = 5000
+
+
+def create_log_view() -> QPlainTextEdit:
+    """Create a read-only, line-capped view for append-only log output"""
+    view = QPlainTextEdit()
+    view.setReadOnly(True)
+    view.setUndoRedoEnabled(False)
+    view.setMaximumBlockCount(LOG_VIEW_MAX_LINES)
+    return view
 
 
 class BaseTab(QWidget):
@@ -24,7 +38,7 @@ class BaseTab(QWidget):
     def __init__(self, gcloud_api: GCloudAPI):
         super().__init__()
         self.gcloud_api = gcloud_api
-        self.workers = []
+        self.pool = worker_pool()
         self.init_ui()
         self.setup_connections()
     
@@ -36,12 +50,17 @@ class BaseTab(QWidget):
         """Setup signal connections - to be overridden by subclasses"""
         pass
     
-    def cleanup_workers(self):
-        """Clean up any running workers"""
-        for worker in self.workers:
-            if worker.isRunning():
-                worker.terminate()
-                worker.wait()
+    def start_worker(self, operation: str, on_result, **kwargs):
+        """Run operation in a background worker and pass its result to on_result
+
+        Holding Shift (e.g. Shift+Click on Refresh) skips cached responses.
+        """
+        if hard_refresh_requested():
+            GCloudRunnable.invalidate(self.gcloud_api, operation)
+        runnable = GCloudRunnable(operation, self.gcloud_api, **kwargs)
+        runnable.signals.result_ready.connect(on_result)
+        runnable.signals.error_occurred.connect(self.error_occurred.emit)
+        self.pool.start(runnable)
 
 
 class ServicesTab(BaseTab):
@@ -69,11 +88,15 @@ class ServicesTab(BaseTab):
         layout.addLayout(header_layout)
         
         # Services table
-        self.services_table = QTableWidget()
-        self.services_table.setColumnCount(5)
-        self.services_table.setHorizontalHeaderLabels([
-            "Service Name", "Status", "URL", "Latest Revision", "Created"
-        ])
+        self.services_model = RecordTableModel([
+            ("Service Name", 'short_name'),
+            ("Status", 'status'),
+            ("URL", 'url'),
+            ("Latest Revision", 'revision'),
+            ("Created", 'created'),
+        ], self)
+        self.services_table = QTableView()
+        self.services_table.setModel(self.services_model)
         self.services_table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self.services_table)
     
@@ -83,24 +106,12 @@ class ServicesTab(BaseTab):
     
     def refresh_services(self):
         """Refresh Cloud Run services"""
-        worker = GCloudWorker("get_services", self.gcloud_api)
-        worker.result_ready.connect(self.on_services_loaded)
-        worker.error_occurred.connect(self.error_occurred.emit)
-        self.workers.append(worker)
-        worker.start()
+        self.start_worker("get_services", self.on_services_loaded)
     
     def on_services_loaded(self, result):
         """Handle services loaded result"""
         if result['success'] and result['type'] == 'services':
-            services = result['data']
-            self.services_table.setRowCount(len(services))
-            
-            for i, service in enumerate(services):
-                self.services_table.setItem(i, 0, QTableWidgetItem(service['name'].split('/')[-1]))
-                self.services_table.setItem(i, 1, QTableWidgetItem(service['status']))
-                self.services_table.setItem(i, 2, QTableWidgetItem(service['url']))
-                self.services_table.setItem(i, 3, QTableWidgetItem(service['revision']))
-                self.services_table.setItem(i, 4, QTableWidgetItem(service['created']))
+            self.services_model.set_rows(result['data'])
         else:
             self.error_occurred.emit(result.get('error', 'Unknown error'))
     
@@ -153,8 +164,7 @@ class BuildTab(BaseTab):
         layout.addLayout(actions_layout)
         
         # Build logs
-        self.build_logs = QTextEdit()
-        self.build_logs.setReadOnly(True)
+        self.build_logs = create_log_view()
         layout.addWidget(QLabel("Build Logs:"))
         layout.addWidget(self.build_logs)
     
@@ -174,16 +184,12 @@ class BuildTab(BaseTab):
             'image_name': self.build_image_name.text()
         }
         
-        worker = GCloudWorker("build_image", self.gcloud_api, build_config=build_config)
-        worker.result_ready.connect(self.on_build_completed)
-        worker.error_occurred.connect(self.error_occurred.emit)
-        self.workers.append(worker)
-        worker.start()
+        self.start_worker("build_image", self.on_build_completed, build_config=build_config)
     
     def on_build_completed(self, result):
         """Handle build completion"""
         if result['success'] and result['type'] == 'build_started':
-            self.build_logs.append(f"Build started: {result['data']['operation']}")
+            self.build_logs.appendPlainText(f"Build started: {result['data']['operation']}")
         else:
             self.error_occurred.emit(result.get('error', 'Unknown error'))
     
@@ -193,16 +199,12 @@ class BuildTab(BaseTab):
             QMessageBox.warning(self, "Error", "Please enter an image name")
             return
         
-        worker = GCloudWorker("push_image", self.gcloud_api, image_name=self.build_image_name.text())
-        worker.result_ready.connect(self.on_push_completed)
-        worker.error_occurred.connect(self.error_occurred.emit)
-        self.workers.append(worker)
-        worker.start()
+        self.start_worker("push_image", self.on_push_completed, image_name=self.build_image_name.text())
     
     def on_push_completed(self, result):
         """Handle push completion"""
         if result['success'] and result['type'] == 'push_completed':
-            self.build_logs.append(result['data']['message'])
+            self.build_logs.appendPlainText(result['data']['message'])
         else:
             self.error_occurred.emit(result.get('error', 'Unknown error'))
 
@@ -228,11 +230,13 @@ class ImagesTab(BaseTab):
         layout.addLayout(header_layout)
         
         # Images table
-        self.images_table = QTableWidget()
-        self.images_table.setColumnCount(3)
-        self.images_table.setHorizontalHeaderLabels([
-            "Repository Name", "Format", "Description"
-        ])
+        self.images_model = RecordTableModel([
+            ("Repository Name", 'name'),
+            ("Format", 'format'),
+            ("Description", 'description'),
+        ], self)
+        self.images_table = QTableView()
+        self.images_table.setModel(self.images_model)
         self.images_table.horizontalHeader().setStretchLastSection(True)
         layout.addWidget(self.images_table)
     
@@ -242,22 +246,12 @@ class ImagesTab(BaseTab):
     
     def refresh_images(self):
         """Refresh container images"""
-        worker = GCloudWorker("get_images", self.gcloud_api)
-        worker.result_ready.connect(self.on_images_loaded)
-        worker.error_occurred.connect(self.error_occurred.emit)
-        self.workers.append(worker)
-        worker.start()
+        self.start_worker("get_images", self.on_images_loaded)
     
     def on_images_loaded(self, result):
         """Handle images loaded result"""
         if result['success'] and result['type'] == 'images':
-            images = result['data']
-            self.images_table.setRowCount(len(images))
-            
-            for i, image in enumerate(images):
-                self.images_table.setItem(i, 0, QTableWidgetItem(image['name']))
-                self.images_table.setItem(i, 1, QTableWidgetItem(image['format']))
-                self.images_table.setItem(i, 2, QTableWidgetItem(image['description']))
+            self.images_model.set_rows(result['data'])
         else:
             self.error_occurred.emit(result.get('error', 'Unknown error'))
 
@@ -267,6 +261,7 @@ class LogsTab(BaseTab):
     
     def init_ui(self):
         """Initialize the logs tab UI"""
+        self.stream_generation = 0
         layout = QVBoxLayout(self)
         
         # Filter controls
@@ -290,8 +285,7 @@ class LogsTab(BaseTab):
         layout.addLayout(filter_layout)
         
         # Logs display
-        self.logs_display = QTextEdit()
-        self.logs_display.setReadOnly(True)
+        self.logs_display = create_log_view()
         layout.addWidget(self.logs_display)
     
     def setup_connections(self):
@@ -299,26 +293,43 @@ class LogsTab(BaseTab):
         pass
     
     def refresh_logs(self):
-        """Refresh logs"""
+        """Refresh logs, showing each page as it arrives"""
         filter_str = "resource.type=cloud_run_revision"  # Default filter
-        worker = GCloudWorker("get_logs", self.gcloud_api, filter_str=filter_str)
-        worker.result_ready.connect(self.on_logs_loaded)
-        worker.error_occurred.connect(self.error_occurred.emit)
-        self.workers.append(worker)
-        worker.start()
+        # Pages from streams started before this one are dropped on arrival
+        self.stream_generation += 1
+        self.logs_display.clear()
+        self.start_worker(
+            "stream_logs",
+            functools.partial(self.on_log_page_loaded, self.stream_generation),
+            filter_str=filter_str
+        )
     
     def on_logs_loaded(self, result):
         """Handle logs loaded result"""
         if result['success'] and result['type'] == 'logs':
-            logs = result['data']
-            
-            log_text = ""
-            for log in logs:
-                log_text += f"[{log['timestamp']}] {log['severity']}: {log['text_payload']}\n"
-            
-            self.logs_display.setText(log_text)
+            self.stream_generation += 1
+            self.logs_display.clear()
+            self.append_logs(result['data'])
         else:
             self.error_occurred.emit(result.get('error', 'Unknown error'))
+    
+    def on_log_page_loaded(self, generation, result):
+        """Handle one page of a streamed logs result"""
+        if generation != self.stream_generation:
+            return
+        if result['success'] and result['type'] == 'logs':
+            self.append_logs(result['data'])
+        else:
+            self.error_occurred.emit(result.get('error', 'Unknown error'))
+    
+    def append_logs(self, logs):
+        """Append column-wise log entries to the logs display"""
+        lines = [
+            f"[{timestamp.isoformat() if timestamp else 'Unknown'}] {severity_name(severity)}: {payload}"
+            for timestamp, severity, payload in zip(logs['timestamps'], logs['severities'], logs['payloads'])
+        ]
+        if lines:
+            self.logs_display.appendPlainText("\n".join(lines))
 
 
 class IAMTab(BaseTab):
@@ -346,11 +357,14 @@ class IAMTab(BaseTab):
         sa_header.addStretch()
         sa_layout.addLayout(sa_header)
         
-        self.sa_table = QTableWidget()
-        self.sa_table.setColumnCount(4)
-        self.sa_table.setHorizontalHeaderLabels([
-            "Name", "Email", "Display Name", "Description"
-        ])
+        self.sa_model = RecordTableModel([
+            ("Name", 'name'),
+            ("Email", 'email'),
+            ("Display Name", 'display_name'),
+            ("Description", 'description'),
+        ], self)
+        self.sa_table = QTableView()
+        self.sa_table.setModel(self.sa_model)
         sa_layout.addWidget(self.sa_table)
         
         # Permissions section
@@ -390,44 +404,34 @@ class IAMTab(BaseTab):
     
     def refresh_service_accounts(self):
         """Refresh service accounts"""
-        worker = GCloudWorker("get_service_accounts", self.gcloud_api)
-        worker.result_ready.connect(self.on_service_accounts_loaded)
-        worker.error_occurred.connect(self.error_occurred.emit)
-        self.workers.append(worker)
-        worker.start()
+        self.start_worker("get_service_accounts", self.on_service_accounts_loaded)
     
     def on_service_accounts_loaded(self, result):
         """Handle service accounts loaded result"""
         if result['success'] and result['type'] == 'service_accounts':
-            accounts = result['data']
-            self.sa_table.setRowCount(len(accounts))
-            
-            for i, account in enumerate(accounts):
-                self.sa_table.setItem(i, 0, QTableWidgetItem(account['name']))
-                self.sa_table.setItem(i, 1, QTableWidgetItem(account['email']))
-                self.sa_table.setItem(i, 2, QTableWidgetItem(account['display_name']))
-                self.sa_table.setItem(i, 3, QTableWidgetItem(account['description']))
+            self.sa_model.set_rows(result['data'])
         else:
             self.error_occurred.emit(result.get('error', 'Unknown error'))
     
     def refresh_permissions(self):
         """Refresh IAM permissions"""
-        worker = GCloudWorker("get_permissions", self.gcloud_api)
-        worker.result_ready.connect(self.on_permissions_loaded)
-        worker.error_occurred.connect(self.error_occurred.emit)
-        self.workers.append(worker)
-        worker.start()
+        self.start_worker("get_permissions", self.on_permissions_loaded)
     
     def on_permissions_loaded(self, result):
         """Handle permissions loaded result"""
         if result['success'] and result['type'] == 'permissions':
-            permissions = result['data']
-            self.perm_tree.clear()
+            items = [
+                QTreeWidgetItem([perm['role'], ', '.join(perm['members'])])
+                for perm in result['data']
+            ]
             
-            for perm in permissions:
-                item = QTreeWidgetItem(self.perm_tree)
-                item.setText(0, perm['role'])
-                item.setText(1, ', '.join(perm['members']))
+            # Repaint once for the whole policy rather than per inserted row
+            self.perm_tree.setUpdatesEnabled(False)
+            try:
+                self.perm_tree.clear()
+                self.perm_tree.addTopLevelItems(items)
+            finally:
+                self.perm_tree.setUpdatesEnabled(True)
         else:
             self.error_occurred.emit(result.get('error', 'Unknown error'))
     
@@ -1,53 +1,148 @@
 """
 Background Workers for Google Cloud Operations
-This module contains QThread-based workers for non-blocking API operations.
+This module contains thread-pool runnables for non-blocking API operations.
 """
 
 from typing import Dict, Any, Optional
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QGuiApplication
 
 from core.gcloudapi import GCloudAPI
 
 
-class GCloudWorker(QThread):
-    """Background worker for Google Cloud operations"""
-    result_ready = pyqtSignal(dict)
-    error_occurred = pyqtSignal(str)
-    progress_updated = pyqtSignal(int)
+# Upper bound on Google Cloud operations running at once. Fan-out operations
+# ("prefetch", "refresh_all") hold one pool slot and run their getters on
+# GCloudAPI.refresh_all's private executor.
+MAX_WORKER_THREADS = 4
+
+
+def _required(kwargs: Dict[str, Any], name: str) -> Any:
+    """Return kwargs[name], raising ValueError when the caller left it out"""
+    if not kwargs.get(name):
+        raise ValueError(f"Missing required argument: {name}")
+    return kwargs[name]
+
+
+class GCloudRunnable(QRunnable):
+    """Background task for Google Cloud operations, run on the shared thread pool"""
+
+    class Signals(QObject):
+        """QRunnable is not a QObject, so its signals live here"""
+        result_ready = pyqtSignal(dict)
+        error_occurred = pyqtSignal(str)
+        progress_updated = pyqtSignal(int)
+
+    # Operation name -> handler(gcloud_api, kwargs)
+    _DISPATCH = {
+        "get_services": lambda api, kw: api.get_cloud_run_services(),
+        "create_service": lambda api, kw: api.create_cloud_run_service(kw.get('service_config', {})),
+        "get_images": lambda api, kw: api.get_container_images(),
+        "get_logs": lambda api, kw: api.get_logs(kw.get('filter_str', "resource.type=cloud_run_revision")),
+        "build_image": lambda api, kw: api.build_image(kw.get('build_config', {})),
+        "push_image": lambda api, kw: api.push_image(kw.get('image_name', '')),
+        "get_service_accounts": lambda api, kw: api.get_service_accounts(),
+        "get_permissions": lambda api, kw: api.get_permissions(),
+        "check_auth": lambda api, kw: api.check_authentication(),
+        "prefetch": lambda api, kw: api.refresh_all(
+            ('get_cloud_run_services', 'get_container_images', 'get_logs')
+        ),
+        "refresh_all": lambda api, kw: api.refresh_all(),
+        "add_permission": lambda api, kw: api.add_permission(
+            _required(kw, 'role'),
+            _required(kw, 'member')
+        ),
+    }
+
+    # Operation name -> handler(gcloud_api, kwargs) returning an iterator of
+    # results, each emitted on result_ready as soon as it is produced
+    _STREAMS = {
+        "stream_logs": lambda api, kw: api.iter_log_pages(
+            kw.get('filter_str', "resource.type=cloud_run_revision"),
+            **{name: kw[name] for name in ('max_entries', 'page_size') if name in kw}
+        ),
+    }
+
+    # Read-only operation -> GCloudAPI method whose cached responses it returns
+    # (None: every cached method); mutating operations never hit the cache
+    _CACHED_METHODS = {
+        "get_services": 'get_cloud_run_services',
+        "get_images": 'get_container_images',
+        "get_logs": 'get_logs',
+        "get_permissions": 'get_permissions',
+        "prefetch": None,
+        "refresh_all": None,
+    }
 
     def __init__(self, operation: str, gcloud_api: GCloudAPI, **kwargs):
         super().__init__()
         self.operation = operation
         self.gcloud_api = gcloud_api
         self.kwargs = kwargs
+        self.signals = self.Signals()
 
     def run(self):
         """Execute the specified operation"""
         try:
-            if self.operation == "get_services":
-                result = self.gcloud_api.get_cloud_run_services()
-            elif self.operation == "create_service":
-                result = self.gcloud_api.create_cloud_run_service(self.kwargs.get('service_config', {}))
-            elif self.operation == "get_images":
-                result = self.gcloud_api.get_container_images()
-            elif self.operation == "get_logs":
-                result = self.gcloud_api.get_logs(self.kwargs.get('filter_str', "resource.type=cloud_run_revision"))
-            elif self.operation == "build_image":
-                result = self.gcloud_api.build_image(self.kwargs.get('build_config', {}))
-            elif self.operation == "push_image":
-                result = self.gcloud_api.push_image(self.kwargs.get('image_name', ''))
-            elif self.operation == "get_service_accounts":
-                result = self.gcloud_api.get_service_accounts()
-            elif self.operation == "get_permissions":
-                result = self.gcloud_api.get_permissions()
-            elif self.operation == "add_permission":
-                result = self.gcloud_api.add_permission(
-                    self.kwargs.get('role', 'roles/viewer'),
-                    self.kwargs.get('member', 'user:example@example.com')
-                )
-            else:
-                raise ValueError(f"Unknown operation: {self.operation}")
+            stream = self._STREAMS.get(self.operation)
+            if stream is not None:
+                for result in stream(self.gcloud_api, self.kwargs):
+                    self.signals.result_ready.emit(result)
+                return
             
-            self.result_ready.emit(result)
+            result = self._execute(self.gcloud_api, self.operation, self.kwargs)
+            self.signals.result_ready.emit(result)
         except Exception as e:
-            self.error_occurred.emit(str(e)) 
\ No newline at end of file
+            self.signals.error_occurred.emit(str(e))
+
+    @classmethod
+    def invalidate(cls, gcloud_api: GCloudAPI, operation: str):
+        """Drop the cached responses operation would return, forcing a refetch"""
+        if operation in cls._CACHED_METHODS:
+            gcloud_api.invalidate_cache(cls._CACHED_METHODS[operation])
+
+    @classmethod
+    def _execute(cls, gcloud_api: GCloudAPI, operation: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a single operation and return its result"""
+        handler = cls._DISPATCH.get(operation)
+        if handler is None:
+            raise ValueError(f"Unknown operation: {operation}")
+        return handler(gcloud_api, kwargs)
+
+
+class PrefetchCoordinator(QObject):
+    """Fans out the results of a single start-up "prefetch" worker to the tabs"""
+    services_loaded = pyqtSignal(dict)
+    images_loaded = pyqtSignal(dict)
+    logs_loaded = pyqtSignal(dict)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def distribute(self, results: Dict[str, Dict[str, Any]]):
+        """Keep successful results and emit each on its signal"""
+        for key, result in results.items():
+            # Failures are left for the tab's own refresh to report
+            if result['success']:
+                self.results[key] = result
+                getattr(self, f"{key}_loaded").emit(result)
+
+
+def hard_refresh_requested() -> bool:
+    """Whether Shift is held, asking a refresh to bypass cached responses"""
+    return bool(QGuiApplication.keyboardModifiers() & Qt.KeyboardModifier.ShiftModifier)
+
+
+def worker_pool() -> QThreadPool:
+    """Return the shared thread pool, capped at MAX_WORKER_THREADS"""
+    pool = QThreadPool.globalInstance()
+    if pool.maxThreadCount() != MAX_WORKER_THREADS:
+        pool.setMaxThreadCount(MAX_WORKER_THREADS)
+    return pool
+
+
+def stop_workers(timeout_ms: int = 2000) -> bool:
+    """Drop queued operations and wait up to timeout_ms for running ones"""
+    pool = worker_pool()
+    pool.clear()
+    return pool.waitForDone(timeout_ms)